@@ -0,0 +1,126 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing, suppress
+from typing import Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from app.schemas import LiveDraftUpdate
+
+DraftGenerator = Callable[[str], AsyncIterator[dict]]
+
+
+class LiveDraftSession:
+    """Debounced, cancellable regeneration for one live-drafting WebSocket.
+
+    The client streams the full note text on every edit. Once the text has been
+    stable for ``debounce`` seconds the session regenerates the draft, pushing each
+    result as soon as it is ready. A run whose input has gone stale is cancelled
+    before a new one starts, so speculative work never stacks up upstream.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        generate: DraftGenerator,
+        *,
+        debounce: float,
+    ) -> None:
+        self._websocket = websocket
+        self._generate = generate
+        self._debounce = debounce
+        self._text = ""
+        self._version = 0
+        self._debounce_task: Optional[asyncio.Task] = None
+        self._generation_task: Optional[asyncio.Task] = None
+        self._generation_text: Optional[str] = None
+        self._idle = True
+
+    async def run(self) -> None:
+        try:
+            await self._receive_updates()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            await self._cancel_all()
+
+    async def _receive_updates(self) -> None:
+        while True:
+            message = await self._websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            update = self._parse_update(message)
+            if update is None:
+                await self._cancel_all()
+                await self._websocket.close(code=1003)
+                return
+            await self._on_update(update.text.strip())
+
+    @staticmethod
+    def _parse_update(message: dict) -> Optional[LiveDraftUpdate]:
+        # Only JSON text frames are part of the protocol; binary frames are rejected.
+        raw = message.get("text")
+        if raw is None:
+            return None
+        try:
+            return LiveDraftUpdate.model_validate_json(raw)
+        except ValidationError:
+            return None
+
+    async def _on_update(self, text: str) -> None:
+        self._text = text
+        await self._cancel(self._debounce_task)
+        if text != self._generation_text:
+            # The in-flight run (if any) is for outdated notes; stop it now.
+            await self._cancel(self._generation_task)
+            self._generation_text = None
+        if not text:
+            # Nothing will replace the cancelled run, so tell the client to clear it.
+            await self._send_idle()
+            return
+        self._debounce_task = asyncio.create_task(self._regenerate_after_debounce())
+
+    async def _send_idle(self) -> None:
+        if self._idle:
+            return
+        self._idle = True
+        self._version += 1
+        await self._websocket.send_json({"type": "idle", "version": self._version})
+
+    async def _regenerate_after_debounce(self) -> None:
+        await asyncio.sleep(self._debounce)
+        text = self._text
+        if text == self._generation_text:
+            return
+
+        await self._cancel(self._generation_task)
+        self._idle = False
+        self._version += 1
+        self._generation_text = text
+        self._generation_task = asyncio.create_task(self._push_results(self._version, text))
+
+    async def _push_results(self, version: int, text: str) -> None:
+        try:
+            await self._websocket.send_json({"type": "pending", "version": version})
+            # aclosing() makes cancellation reach the generator even while it is
+            # parked at a yield, so its upstream runs are cancelled immediately.
+            async with aclosing(self._generate(text)) as results:
+                async for message in results:
+                    await self._websocket.send_json({**message, "version": version})
+            await self._websocket.send_json({"type": "done", "version": version})
+        except WebSocketDisconnect:
+            pass
+
+    async def _cancel_all(self) -> None:
+        await self._cancel(self._debounce_task)
+        await self._cancel(self._generation_task)
+
+    @staticmethod
+    async def _cancel(task: Optional[asyncio.Task]) -> None:
+        if task is None or task.done():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
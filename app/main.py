@@ -1,11 +1,17 @@
+import asyncio
+import logging
 import os
+import time
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from functools import lru_cache
+from urllib.parse import urlsplit
 
-from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket
 from fastapi.responses import HTMLResponse, StreamingResponse
-from fastapi.templating import Jinja2Templates
 
+from app.live_draft import LiveDraftSession
 from app.prompts import REPLY_SYSTEM, SUMMARIZE_SYSTEM, TRIAGE_SYSTEM
 from app.schemas import ModeRequest, ReplyResponse, SummarizeResponse, TriageResponse
 from app.you_client import YouClient
@@ -13,9 +19,11 @@ from app.you_client import YouClient
 AGENT_ID_SUMMARIZE = os.getenv("YOU_AGENT_SUMMARIZE_ID", "express")
 AGENT_ID_TRIAGE = os.getenv("YOU_AGENT_TRIAGE_ID", "express")
 AGENT_ID_REPLY = os.getenv("YOU_AGENT_REPLY_ID", "express")
+# Re-warm well inside the pooled connection's keep-alive window so "ready" keeps
+# meaning "a warm connection is waiting" for as long as probes keep arriving.
+WARM_UP_INTERVAL_SECONDS = 30.0
 
-app = FastAPI(title="Clinician Helper")
-templates = Jinja2Templates(directory="app/templates")
+logger = logging.getLogger(__name__)
 
 
 @lru_cache(maxsize=1)
@@ -23,9 +31,118 @@ def get_you_client() -> YouClient:
     return YouClient()
 
 
+@lru_cache(maxsize=1)
+def get_live_draft_debounce() -> float:
+    raw = os.getenv("LIVE_DRAFT_DEBOUNCE_MS", "800")
+    try:
+        debounce_ms = float(raw)
+    except ValueError:
+        debounce_ms = -1.0
+    if not debounce_ms >= 0:  # also rejects nan
+        raise RuntimeError(
+            f"Invalid LIVE_DRAFT_DEBOUNCE_MS: {raw!r} (expected a non-negative number)"
+        )
+    return debounce_ms / 1000
+
+
+@lru_cache(maxsize=1)
+def get_templates():
+    # Jinja is only needed for the UI page, so keep it off the import path.
+    from fastapi.templating import Jinja2Templates
+
+    return Jinja2Templates(directory="app/templates")
+
+
+async def _warm_up(app: FastAPI) -> None:
+    try:
+        await app.state.you_client.warm_up()
+    except Exception as exc:
+        logger.warning("You.com connection warm-up failed: %s", exc)
+        app.state.ready = False
+        return
+    app.state.warmed_at = time.monotonic()
+    app.state.ready = True
+
+
+def _ensure_warm_up(app: FastAPI) -> None:
+    task = app.state.warm_up_task
+    if task is None or task.done():
+        app.state.warm_up_task = asyncio.create_task(_warm_up(app))
+
+
+def _refresh_warm_up(app: FastAPI) -> None:
+    # Retry a failed warm-up, and refresh the pooled connection before the remote
+    # end or keep-alive drops it. Never blocks the probe that triggered it.
+    state = app.state
+    if state.ready and time.monotonic() - state.warmed_at < WARM_UP_INTERVAL_SECONDS:
+        return
+    _ensure_warm_up(app)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Resolve through dependency overrides so tests and benchmarks can inject config.
+    client_factory = app.dependency_overrides.get(get_you_client, get_you_client)
+    debounce_factory = app.dependency_overrides.get(get_live_draft_debounce, get_live_draft_debounce)
+    debounce_factory()  # raises on an invalid LIVE_DRAFT_DEBOUNCE_MS at boot
+    app.state.you_client = client_factory()  # raises on missing YOU_API_KEY at boot
+    app.state.ready = False
+    app.state.warmed_at = None
+    app.state.warm_up_task = None
+    _ensure_warm_up(app)
+    try:
+        yield
+    finally:
+        app.state.ready = False
+        app.state.warm_up_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await app.state.warm_up_task
+        await app.state.you_client.aclose()
+
+
+app = FastAPI(title="Clinician Helper", lifespan=lifespan)
+
+
+def _summarize_content(text: str) -> str:
+    return f"{SUMMARIZE_SYSTEM}\n\n---\nNOTES:\n{text}"
+
+
+def _triage_content(text: str) -> str:
+    return (
+        f"{TRIAGE_SYSTEM}\n\n---\nCALL NOTES:\n{text}\n\n"
+        "Output as a numbered list."
+    )
+
+
+def _split_questions(text: str) -> list[str]:
+    questions = [line.strip(" -") for line in text.splitlines() if line.strip()]
+    return questions or [text]
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return get_templates().TemplateResponse("index.html", {"request": request})
+
+
+@app.get("/healthz")
+async def liveness(request: Request):
+    # Platform health checks hit this route, so it must not depend on You.com being
+    # reachable; it only uses the probe to keep the warm-up going.
+    if getattr(request.app.state, "you_client", None) is not None:
+        _refresh_warm_up(request.app)
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readiness(request: Request):
+    state = request.app.state
+    if getattr(state, "you_client", None) is None:
+        raise HTTPException(status_code=503, detail="Not started")
+
+    _refresh_warm_up(request.app)
+    if state.ready:
+        return {"status": "ready"}
+    raise HTTPException(status_code=503, detail="Warming up")
 
 
 @app.post("/api/summarize", response_model=SummarizeResponse)
@@ -33,7 +150,7 @@ async def summarize(
     req: ModeRequest, you_client: YouClient = Depends(get_you_client)
 ):
     stream = bool(req.stream)
-    content = f"{SUMMARIZE_SYSTEM}\n\n---\nNOTES:\n{req.text}"
+    content = _summarize_content(req.text)
 
     try:
         if stream:
@@ -53,10 +170,7 @@ async def summarize(
 @app.post("/api/triage", response_model=TriageResponse)
 async def triage(req: ModeRequest, you_client: YouClient = Depends(get_you_client)):
     stream = bool(req.stream)
-    content = (
-        f"{TRIAGE_SYSTEM}\n\n---\nCALL NOTES:\n{req.text}\n\n"
-        "Output as a numbered list."
-    )
+    content = _triage_content(req.text)
 
     try:
         if stream:
@@ -67,8 +181,7 @@ async def triage(req: ModeRequest, you_client: YouClient = Depends(get_you_clien
         if not text:
             raise HTTPException(status_code=502, detail="Empty response from LLM")
 
-        questions = [line.strip(" -") for line in text.splitlines() if line.strip()]
-        return TriageResponse(questions=questions or [text])
+        return TriageResponse(questions=_split_questions(text))
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover - external service errors
@@ -93,3 +206,64 @@ async def reply(req: ModeRequest, you_client: YouClient = Depends(get_you_client
         raise
     except Exception as exc:  # pragma: no cover - external service errors
         raise HTTPException(status_code=500, detail=str(exc))
+
+
+async def _live_draft_results(you_client: YouClient, text: str) -> AsyncIterator[dict]:
+    runs = {
+        asyncio.create_task(
+            you_client.run_agent(AGENT_ID_SUMMARIZE, _summarize_content(text), stream=False)
+        ): "summary",
+        asyncio.create_task(
+            you_client.run_agent(AGENT_ID_TRIAGE, _triage_content(text), stream=False)
+        ): "triage",
+    }
+    pending = set(runs)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                kind = runs[task]
+                try:
+                    result = task.result()
+                except Exception as exc:  # pragma: no cover - external service errors
+                    yield {"type": "error", "part": kind, "detail": str(exc)}
+                    continue
+                if not result:
+                    yield {"type": "error", "part": kind, "detail": "Empty response from LLM"}
+                elif kind == "summary":
+                    yield {"type": "summary", "summary": result}
+                else:
+                    yield {"type": "triage", "questions": _split_questions(result)}
+    finally:
+        # Reached on cancellation too: stale upstream runs must not outlive the draft.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _is_same_origin(websocket: WebSocket) -> bool:
+    # Browsers skip CORS for WebSocket handshakes but always send Origin, so this is
+    # what stops other sites from spending our API key. Non-browser clients omit it
+    # and are no more capable than they already are against the REST endpoints.
+    origin = websocket.headers.get("origin")
+    if origin is None:
+        return True
+    return urlsplit(origin).netloc == websocket.headers.get("host")
+
+
+@app.websocket("/ws/draft")
+async def live_draft(
+    websocket: WebSocket,
+    you_client: YouClient = Depends(get_you_client),
+    debounce: float = Depends(get_live_draft_debounce),
+):
+    if not _is_same_origin(websocket):
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    session = LiveDraftSession(
+        websocket,
+        lambda text: _live_draft_results(you_client, text),
+        debounce=debounce,
+    )
+    await session.run()
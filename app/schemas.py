@@ -18,3 +18,7 @@ class TriageResponse(BaseModel):
 
 class ReplyResponse(BaseModel):
     reply: str
+
+
+class LiveDraftUpdate(BaseModel):
+    text: str  # full note text as currently typed; may be empty
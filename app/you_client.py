@@ -4,6 +4,9 @@ from typing import Optional
 import httpx
 
 YDC_AGENTS_URL = "https://api-you.com/v1/agents/runs"
+# httpx drops idle pooled connections after 5s by default; keep them long enough
+# to bridge the gap between readiness re-warms (see app.main.WARM_UP_INTERVAL_SECONDS).
+KEEPALIVE_EXPIRY_SECONDS = 120.0
 
 
 class YouClient:
@@ -17,6 +20,30 @@ class YouClient:
         if not self.api_key:
             raise RuntimeError("Missing YOU_API_KEY")
         self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # A single pooled client keeps TCP/TLS connections alive between runs.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def warm_up(self) -> None:
+        # Any HTTP status is fine: the goal is a pooled connection, not a result.
+        await self._get_client().head(YDC_AGENTS_URL)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def run_agent(self, agent: str, content: str, stream: bool = False):
         headers = {
@@ -70,35 +97,35 @@ class YouClient:
         payload_builders = (structured_payload, plain_payload)
         last_error: Optional[httpx.HTTPStatusError] = None
 
-        async with httpx.AsyncClient(timeout=60.0, transport=self._transport) as client:
-            if stream:
-                headers["Accept"] = "text/event-stream"
-                for build_payload in payload_builders:
-                    try:
-                        payload = build_payload()
-                        resp = await post_with_payload(client, payload)
-                        return resp
-                    except httpx.HTTPStatusError as exc:
-                        if exc.response.status_code != 422:
-                            raise
-                        last_error = exc
-
-                detail = last_error.response.text if last_error and last_error.response else ""
-                raise RuntimeError(f"You.com API error 422: {detail}")
-
+        client = self._get_client()
+        if stream:
+            headers["Accept"] = "text/event-stream"
             for build_payload in payload_builders:
                 try:
                     payload = build_payload()
                     resp = await post_with_payload(client, payload)
-                    data = resp.json()
-                    break
+                    return resp
                 except httpx.HTTPStatusError as exc:
                     if exc.response.status_code != 422:
                         raise
                     last_error = exc
-            else:  # pragma: no cover - defensive
-                detail = last_error.response.text if last_error and last_error.response else ""
-                raise RuntimeError(f"You.com API error 422: {detail}")
+
+            detail = last_error.response.text if last_error and last_error.response else ""
+            raise RuntimeError(f"You.com API error 422: {detail}")
+
+        for build_payload in payload_builders:
+            try:
+                payload = build_payload()
+                resp = await post_with_payload(client, payload)
+                data = resp.json()
+                break
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 422:
+                    raise
+                last_error = exc
+        else:  # pragma: no cover - defensive
+            detail = last_error.response.text if last_error and last_error.response else ""
+            raise RuntimeError(f"You.com API error 422: {detail}")
 
         def append_text(acc: list[str], value: object) -> None:
             if isinstance(value, str):
@@ -0,0 +1,102 @@
+"""Cold-start benchmark for the Clinician Helper app.
+
+Each run starts a fresh interpreter and records:
+
+- import: time to import ``app.main``
+- ready: time until ``/readyz`` reports ready (lifespan + connection warm-up)
+- first_request: time until the first successful ``/api/summarize`` response
+
+Upstream calls go through ``httpx.MockTransport`` so the numbers reflect app
+startup only, not You.com latency.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+async def _measure_child() -> dict[str, float]:
+    start = time.perf_counter()
+
+    from app.main import app, get_you_client
+
+    imported = time.perf_counter()
+
+    import httpx
+
+    from app.you_client import YouClient
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, json={"output": [{"text": "Summary"}]})
+
+    you_client = YouClient(api_key="bench", transport=httpx.MockTransport(handler))
+    app.dependency_overrides[get_you_client] = lambda: you_client
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            while (await client.get("/readyz")).status_code != 200:
+                await asyncio.sleep(0.001)
+            ready = time.perf_counter()
+
+            resp = await client.post("/api/summarize", json={"text": "notes"})
+            resp.raise_for_status()
+            first_request = time.perf_counter()
+
+    return {
+        "import": imported - start,
+        "ready": ready - start,
+        "first_request": first_request - start,
+    }
+
+
+def _run_child() -> dict[str, float]:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child"],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_measure_child())))
+        return
+
+    samples = [_run_child() for _ in range(args.runs)]
+    print(f"startup benchmark ({args.runs} runs, fresh interpreter each)")
+    for metric in ("import", "ready", "first_request"):
+        values = [sample[metric] * 1000 for sample in samples]
+        print(
+            f"  {metric:<14} median {statistics.median(values):8.1f} ms"
+            f"  min {min(values):8.1f} ms  max {max(values):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
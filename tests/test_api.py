@@ -1,6 +1,9 @@
+import asyncio
+
 import httpx
 import pytest
 
+import app.main as main
 from app.main import app, get_you_client
 
 
@@ -92,3 +95,148 @@ async def test_reply_returns_502_on_empty_response():
 
     assert resp.status_code == 502
     assert resp.json()["detail"] == "Empty response from LLM"
+
+
+class WarmingStubYouClient(StubYouClient):
+    def __init__(self, response: str):
+        super().__init__(response)
+        self.warm = asyncio.Event()
+        self.warm_ups = 0
+        self.closed = False
+
+    async def warm_up(self) -> None:
+        self.warm_ups += 1
+        await self.warm.wait()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_readiness_reports_ready_only_after_warm_up():
+    stub = WarmingStubYouClient(response="Summarized text")
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            warming = await client.get("/readyz")
+            stub.warm.set()
+            await app.state.warm_up_task
+            ready = await client.get("/readyz")
+
+    app.dependency_overrides.clear()
+
+    assert warming.status_code == 503
+    assert warming.json()["detail"] == "Warming up"
+    assert ready.status_code == 200
+    assert ready.json() == {"status": "ready"}
+    assert stub.closed
+
+
+class FlakyWarmUpStubYouClient(WarmingStubYouClient):
+    async def warm_up(self) -> None:
+        self.warm_ups += 1
+        if self.warm_ups == 1:
+            raise RuntimeError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_readiness_retries_failed_warm_up_on_next_probe():
+    stub = FlakyWarmUpStubYouClient(response="Summarized text")
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            failed_task = app.state.warm_up_task
+            await failed_task
+
+            failed = await client.get("/readyz")
+            retry_task = app.state.warm_up_task
+            await retry_task
+            ready = await client.get("/readyz")
+
+    app.dependency_overrides.clear()
+
+    assert failed.status_code == 503
+    assert failed.json()["detail"] == "Warming up"
+    assert retry_task is not failed_task
+    assert stub.warm_ups == 2
+    assert ready.status_code == 200
+    assert ready.json() == {"status": "ready"}
+
+
+class UnreachableStubYouClient(WarmingStubYouClient):
+    async def warm_up(self) -> None:
+        self.warm_ups += 1
+        raise RuntimeError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_liveness_stays_healthy_while_upstream_is_unreachable():
+    stub = UnreachableStubYouClient(response="Summarized text")
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await app.state.warm_up_task
+            ready = await client.get("/readyz")
+            await app.state.warm_up_task
+
+            failed_task = app.state.warm_up_task
+            live = await client.get("/healthz")
+            retry_task = app.state.warm_up_task
+            await retry_task
+
+    app.dependency_overrides.clear()
+
+    assert ready.status_code == 503
+    assert live.status_code == 200
+    assert live.json() == {"status": "ok"}
+    assert retry_task is not failed_task
+    assert stub.warm_ups == 3
+
+
+@pytest.mark.asyncio
+async def test_readiness_rewarms_stale_connection_while_ready():
+    stub = WarmingStubYouClient(response="Summarized text")
+    stub.warm.set()
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await app.state.warm_up_task
+            first_task = app.state.warm_up_task
+
+            fresh = await client.get("/readyz")
+            assert app.state.warm_up_task is first_task
+
+            app.state.warmed_at -= main.WARM_UP_INTERVAL_SECONDS
+            stale = await client.get("/readyz")
+            assert app.state.warm_up_task is not first_task
+            await app.state.warm_up_task
+
+    app.dependency_overrides.clear()
+
+    assert fresh.status_code == 200
+    assert stale.status_code == 200
+    assert stub.warm_ups == 2
+
+
+@pytest.mark.asyncio
+async def test_startup_fails_without_api_key(monkeypatch):
+    monkeypatch.delenv("YOU_API_KEY", raising=False)
+    get_you_client.cache_clear()
+
+    with pytest.raises(RuntimeError, match="Missing YOU_API_KEY"):
+        async with app.router.lifespan_context(app):
+            pass
+
+    get_you_client.cache_clear()
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from app.main import app, get_live_draft_debounce, get_you_client
+
+
+class RecordingYouClient:
+    def __init__(self, blocking_text: str = ""):
+        self.blocking_text = blocking_text
+        self.started = threading.Event()
+        self.calls: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def run_agent(self, agent: str, content: str, stream: bool = False):
+        self.calls.append(content)
+        if self.blocking_text and self.blocking_text in content:
+            self.started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(content)
+                raise
+        if "CALL NOTES" in content:
+            return "1. Question one\n2. Question two"
+        return "Summary text"
+
+
+def receive_until_done(ws) -> list[dict]:
+    messages = []
+    while True:
+        message = ws.receive_json()
+        messages.append(message)
+        if message["type"] == "done":
+            return messages
+
+
+@pytest.fixture
+def fast_debounce():
+    app.dependency_overrides[get_live_draft_debounce] = lambda: 0.01
+    yield
+    app.dependency_overrides.clear()
+
+
+def test_live_draft_pushes_summary_and_questions(fast_debounce):
+    stub = RecordingYouClient()
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with TestClient(app).websocket_connect(
+        "/ws/draft", headers={"origin": "http://testserver"}
+    ) as ws:
+        ws.send_json({"text": "chest pain"})
+        messages = receive_until_done(ws)
+
+    app.dependency_overrides.clear()
+
+    assert messages[0] == {"type": "pending", "version": 1}
+    assert {"type": "summary", "summary": "Summary text", "version": 1} in messages
+    assert {
+        "type": "triage",
+        "questions": ["1. Question one", "2. Question two"],
+        "version": 1,
+    } in messages
+
+
+def test_live_draft_debounces_rapid_updates():
+    app.dependency_overrides[get_live_draft_debounce] = lambda: 0.2
+    stub = RecordingYouClient()
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with TestClient(app).websocket_connect("/ws/draft") as ws:
+        for text in ("c", "ch", "che", "chest"):
+            ws.send_json({"text": text})
+        messages = receive_until_done(ws)
+
+    app.dependency_overrides.clear()
+
+    assert messages[0] == {"type": "pending", "version": 1}
+    assert len(stub.calls) == 2
+    assert all("NOTES:\nchest" in call for call in stub.calls)
+
+
+def test_live_draft_cancels_stale_run_before_regenerating(fast_debounce):
+    stub = RecordingYouClient(blocking_text="first draft")
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with TestClient(app).websocket_connect("/ws/draft") as ws:
+        ws.send_json({"text": "first draft"})
+        assert ws.receive_json() == {"type": "pending", "version": 1}
+        assert stub.started.wait(timeout=1)
+
+        ws.send_json({"text": "second draft"})
+        messages = receive_until_done(ws)
+
+    app.dependency_overrides.clear()
+
+    assert len(stub.cancelled) == 2
+    assert all("first draft" in content for content in stub.cancelled)
+    assert {message["version"] for message in messages} == {2}
+
+
+def test_live_draft_reports_idle_when_notes_are_cleared(fast_debounce):
+    stub = RecordingYouClient(blocking_text="first draft")
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with TestClient(app).websocket_connect("/ws/draft") as ws:
+        ws.send_json({"text": "first draft"})
+        assert ws.receive_json() == {"type": "pending", "version": 1}
+        assert stub.started.wait(timeout=1)
+
+        ws.send_json({"text": "   "})
+        message = ws.receive_json()
+
+    app.dependency_overrides.clear()
+
+    assert message == {"type": "idle", "version": 2}
+    assert len(stub.cancelled) == 2
+
+
+@pytest.mark.parametrize(
+    "send",
+    [
+        lambda ws: ws.send_text("not json"),
+        lambda ws: ws.send_bytes(b'{"text": "chest pain"}'),
+    ],
+    ids=["invalid-json", "binary-frame"],
+)
+def test_live_draft_rejects_malformed_updates(fast_debounce, send):
+    stub = RecordingYouClient()
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with TestClient(app).websocket_connect("/ws/draft") as ws:
+        send(ws)
+        message = ws.receive()
+
+    app.dependency_overrides.clear()
+
+    assert message == {"type": "websocket.close", "code": 1003, "reason": ""}
+    assert stub.calls == []
+
+
+def test_live_draft_rejects_cross_origin_handshake(fast_debounce):
+    stub = RecordingYouClient()
+    app.dependency_overrides[get_you_client] = lambda: stub
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with TestClient(app).websocket_connect(
+            "/ws/draft", headers={"origin": "https://evil.example"}
+        ):
+            pass
+
+    app.dependency_overrides.clear()
+
+    # TestClient reports the pre-accept close as 1008; real servers answer HTTP 403.
+    assert exc.value.code == 1008
+    assert stub.calls == []
+
+
+@pytest.mark.parametrize("value", ["soon", "-100", "nan"])
+def test_startup_fails_on_invalid_debounce(monkeypatch, value):
+    monkeypatch.setenv("LIVE_DRAFT_DEBOUNCE_MS", value)
+    get_live_draft_debounce.cache_clear()
+
+    with pytest.raises(RuntimeError, match="Invalid LIVE_DRAFT_DEBOUNCE_MS"):
+        with TestClient(app):
+            pass
+
+    get_live_draft_debounce.cache_clear()
@@ -122,3 +122,28 @@ async def test_run_agent_sets_streaming_response_mode():
     response = await client.run_agent("express", "hello", stream=True)
 
     assert isinstance(response, httpx.Response)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reuses_pooled_client():
+    methods = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, json={"output": [{"text": "Hi"}]})
+
+    transport = httpx.MockTransport(handler)
+    client = YouClient(api_key="test", transport=transport)
+
+    await client.warm_up()
+    pooled = client._client
+    result = await client.run_agent("express", "hello", stream=False)
+
+    assert methods == ["HEAD", "POST"]
+    assert result == "Hi"
+    assert client._client is pooled
+
+    await client.aclose()
+    assert pooled.is_closed